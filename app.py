@@ -6,21 +6,93 @@ Provides REST API endpoints for email validation.
 
 import os
 from flask import Flask, request, jsonify
-from flask_cors import CORS
+from flask.json.provider import DefaultJSONProvider
 
 from email_validator import EmailValidator, DNSService
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes responses with orjson.
+
+    orjson serializes in C without key sorting or pretty-printing,
+    which is significantly faster than the stdlib json module,
+    especially for large batch responses.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        # Routes request.get_json() through orjson's C parser too,
+        # which matters most for large /validate/batch request bodies
+        return orjson.loads(s)
+
+
 # Create Flask application
 app = Flask(__name__)
-CORS(app)
+
+# Use orjson for response serialization when available
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+else:
+    # Avoid per-response key sorting and pretty-printing with the
+    # default provider; to_dict() key order is already stable.
+    app.json.sort_keys = False
+    app.json.compact = True
 
 # Configuration
 CHECK_MX = os.environ.get('CHECK_MX', 'false').lower() == 'true'
+ENABLE_CORS = os.environ.get('ENABLE_CORS', 'false').lower() == 'true'
+# Per-query and total DNS time budget; low so a broken domain bounds
+# /validate tail latency at ~DNS_TIMEOUT instead of tens of seconds
+DNS_TIMEOUT = float(os.environ.get('DNS_TIMEOUT', '2'))
+
+# CORS is opt-in: server-to-server callers don't need the per-response
+# header injection and OPTIONS handling it wraps every request with
+if ENABLE_CORS:
+    from flask_cors import CORS
+    CORS(app)
+
+# Domains worth resolving at boot so their first real lookup is a
+# cache hit instead of a DNS round trip
+POPULAR_DOMAINS = [
+    'gmail.com',
+    'outlook.com',
+    'yahoo.com',
+    'hotmail.com',
+    'icloud.com',
+    'proton.me',
+]
+
+def make_dns_service():
+    """Build the DNSService with the configured timeouts and cache.
+
+    Also used by the gunicorn post_fork hook so per-worker resolvers
+    get the same configuration as the one built at import time.
+    """
+    # Optional shared MX cache so multiple gunicorn workers look a
+    # popular domain up once per fleet instead of once per process
+    mx_cache = None
+    redis_url = os.environ.get('MX_CACHE_REDIS_URL')
+    if redis_url:
+        import redis
+        mx_cache = redis.Redis.from_url(redis_url)
+
+    return DNSService(timeout=DNS_TIMEOUT, lifetime=DNS_TIMEOUT,
+                      cache_backend=mx_cache)
+
 
 # Initialize validator
 dns_service = None
 if CHECK_MX:
-    dns_service = DNSService(timeout=5)
+    dns_service = make_dns_service()
+    dns_service.prewarm(POPULAR_DOMAINS)
 
 validator = EmailValidator(check_mx=CHECK_MX, dns_service=dns_service)
 
@@ -139,19 +211,33 @@ def validate_batch():
             'error': 'emails array cannot be empty'
         }), 400
 
-    # Validate emails
-    results = validator.validate_batch(emails)
-
-    # Count valid and invalid
-    valid_count = sum(1 for r in results if r.is_valid)
-    invalid_count = len(results) - valid_count
-
-    return jsonify({
-        'results': [r.to_dict() for r in results],
-        'total': len(results),
-        'valid_count': valid_count,
-        'invalid_count': invalid_count
-    }), 200
+    # Stream results as they are produced instead of materializing
+    # the whole response: time-to-first-byte and memory use stay O(1)
+    # in the batch size
+    def generate():
+        dumps = app.json.dumps
+        if CHECK_MX:
+            # validate_batch fans MX lookups out in parallel, so
+            # validate up front and stream only the serialization
+            results = iter(validator.validate_batch(emails))
+        else:
+            results = (validator.validate(email) for email in emails)
+
+        total = 0
+        valid_count = 0
+        yield '{"results": ['
+        first = True
+        for result in results:
+            total += 1
+            if result.is_valid:
+                valid_count += 1
+            prefix = '' if first else ', '
+            first = False
+            yield prefix + dumps(result.to_dict())
+        yield (f'], "total": {total}, "valid_count": {valid_count}, '
+               f'"invalid_count": {total - valid_count}}}')
+
+    return app.response_class(generate(), mimetype='application/json'), 200
 
 
 @app.route('/quick-check', methods=['GET'])
@@ -181,6 +267,69 @@ def quick_check():
     }), 200
 
 
+@app.route('/quick-check/batch', methods=['POST'])
+def quick_check_batch():
+    """
+    Aggregated quick validation for multiple emails.
+
+    Lets clients that would otherwise issue many individual
+    /quick-check requests coalesce them into a single POST,
+    amortizing HTTP overhead across the batch.
+
+    Request Body:
+        {
+            "emails": ["user1@example.com", "user2@example.com"]
+        }
+
+    Returns:
+        JSON response with simple valid/invalid statuses:
+        {
+            "results": [
+                {"email": "user1@example.com", "is_valid": true},
+                ...
+            ]
+        }
+    """
+    # Check content type
+    if not request.is_json:
+        return jsonify({
+            'error': 'Content-Type must be application/json'
+        }), 415
+
+    # Get request data
+    data = request.get_json()
+
+    if data is None:
+        return jsonify({
+            'error': 'Invalid JSON body'
+        }), 400
+
+    # Get emails from request
+    emails = data.get('emails')
+
+    if emails is None:
+        return jsonify({
+            'error': 'Missing required field: emails'
+        }), 400
+
+    if not isinstance(emails, list):
+        return jsonify({
+            'error': 'emails must be an array'
+        }), 400
+
+    if len(emails) == 0:
+        return jsonify({
+            'error': 'emails array cannot be empty'
+        }), 400
+
+    return jsonify({
+        'results': [
+            {'email': email, 'is_valid': validator.is_valid(email)}
+            for email in emails
+        ]
+    }), 200
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
@@ -5,9 +5,20 @@ Provides DNS lookup functionality for email validation.
 """
 
 import socket
+import sys
+import threading
+import time
 from typing import Optional, List
 from abc import ABC, abstractmethod
 
+# dnspython is optional; import it once at module scope so the hot
+# lookup path doesn't pay a sys.modules hit per query
+try:
+    import dns.resolver
+    import dns.exception
+except ImportError:
+    dns = None
+
 
 class DNSServiceBase(ABC):
     """Abstract base class for DNS services."""
@@ -47,21 +58,44 @@ class DNSService(DNSServiceBase):
     Falls back to socket-based resolution if dns is not available.
     """
 
-    def __init__(self, timeout: int = 5):
+    # Cache TTLs in seconds; negative results expire faster because
+    # a missing MX record is often transient (DNS hiccup, new domain)
+    POSITIVE_TTL = 900
+    NEGATIVE_TTL = 60
+
+    def __init__(self, timeout: int = 5, lifetime: float = 2.0,
+                 cache_backend=None):
         """
         Initialize the DNS service.
 
         Args:
-            timeout: DNS query timeout in seconds
+            timeout: Timeout for a single DNS query in seconds
+            lifetime: Total time budget across retries in seconds;
+                     kept low so a broken domain can't stall a
+                     request for tens of seconds
+            cache_backend: Optional shared cache shared across worker
+                          processes (e.g. a redis.Redis client); any
+                          object with get(key) and setex(key, ttl,
+                          value) works. Keys are 'mx:{domain}' with
+                          values '1'/'0'.
         """
         self.timeout = timeout
+        self.lifetime = lifetime
         self._use_dnspython = False
 
+        # In-process TTL cache: domain -> (has_mx, expiry timestamp).
+        # Guarded by a lock so it is safe under threaded workers.
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._cache_backend = cache_backend
+
+        # One-time availability probe; the lookup methods themselves
+        # use the module-level import
         try:
             import dns.resolver
             self._resolver = dns.resolver.Resolver()
             self._resolver.timeout = timeout
-            self._resolver.lifetime = timeout
+            self._resolver.lifetime = lifetime
             self._use_dnspython = True
         except ImportError:
             self._resolver = None
@@ -70,23 +104,58 @@ class DNSService(DNSServiceBase):
         """
         Check if MX record exists for a domain.
 
+        Results are cached per domain so repeated lookups of popular
+        domains skip the network within the TTL window.
+
         Args:
             domain: The domain to check
 
         Returns:
             True if MX record exists, False otherwise
         """
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.get(domain)
+            if cached is not None and now < cached[1]:
+                return cached[0]
+
+        # Shared cache next: lets every worker reuse a lookup done by
+        # any other worker. Backend failures just fall through to DNS.
+        if self._cache_backend is not None:
+            try:
+                value = self._cache_backend.get(f'mx:{domain}')
+            except Exception:
+                value = None
+            if value is not None:
+                has_mx = value in (b'1', '1')
+                ttl = self.POSITIVE_TTL if has_mx else self.NEGATIVE_TTL
+                with self._cache_lock:
+                    self._cache[domain] = (has_mx, now + ttl)
+                return has_mx
+
         if self._use_dnspython:
-            return self._check_mx_dnspython(domain)
+            has_mx = self._check_mx_dnspython(domain)
         else:
-            return self._check_mx_socket(domain)
+            has_mx = self._check_mx_socket(domain)
+
+        ttl = self.POSITIVE_TTL if has_mx else self.NEGATIVE_TTL
+        with self._cache_lock:
+            self._cache[domain] = (has_mx, now + ttl)
+        if self._cache_backend is not None:
+            try:
+                self._cache_backend.setex(
+                    f'mx:{domain}', ttl, '1' if has_mx else '0'
+                )
+            except Exception:
+                pass
+        return has_mx
 
     def _check_mx_dnspython(self, domain: str) -> bool:
         """Check MX record using dnspython library."""
-        try:
-            import dns.resolver
-            import dns.exception
+        if dns is None:
+            return False
 
+        try:
             answers = self._resolver.resolve(domain, 'MX')
             return len(answers) > 0
         except dns.resolver.NXDOMAIN:
@@ -111,6 +180,10 @@ class DNSService(DNSServiceBase):
 
         This is a simplified check that may not work for all cases.
         """
+        # getaddrinfo has no per-call timeout, so the global default
+        # is set for the duration of the lookup and restored after
+        # instead of being left changed for unrelated code
+        old_timeout = socket.getdefaulttimeout()
         try:
             # Try to resolve the domain as a fallback
             # If the domain resolves, it might accept mail
@@ -123,6 +196,30 @@ class DNSService(DNSServiceBase):
             return False
         except Exception:
             return False
+        finally:
+            socket.setdefaulttimeout(old_timeout)
+
+    def prewarm(self, domains: List[str]) -> threading.Thread:
+        """
+        Warm the MX cache for a list of domains in the background.
+
+        Meant to be called once at startup with the most popular email
+        domains so their first real lookup is already a cache hit. The
+        lookups run on a daemon thread and never block the caller.
+
+        Args:
+            domains: Domains to resolve ahead of time
+
+        Returns:
+            The started daemon thread (mainly useful for tests)
+        """
+        def warm():
+            for domain in domains:
+                self.check_mx_record(domain)
+
+        thread = threading.Thread(target=warm, daemon=True)
+        thread.start()
+        return thread
 
     def get_mx_records(self, domain: str) -> List[tuple]:
         """
@@ -134,13 +231,10 @@ class DNSService(DNSServiceBase):
         Returns:
             List of (priority, server) tuples
         """
-        if not self._use_dnspython:
+        if not self._use_dnspython or dns is None:
             return []
 
         try:
-            import dns.resolver
-            import dns.exception
-
             answers = self._resolver.resolve(domain, 'MX')
             records = []
             for rdata in answers:
@@ -150,6 +244,12 @@ class DNSService(DNSServiceBase):
             return []
 
 
+# Interned method names for MockDNSService.call_history entries so
+# history tuples compare by identity on the method-name slot
+_CHECK_MX_RECORD = sys.intern('check_mx_record')
+_GET_MX_RECORDS = sys.intern('get_mx_records')
+
+
 class MockDNSService(DNSServiceBase):
     """
     Mock DNS service for testing purposes.
@@ -167,6 +267,10 @@ class MockDNSService(DNSServiceBase):
         """
         self.responses = responses or {}
         self.call_history = []
+        # Memoized get_mx_records results per domain, invalidated by
+        # set_response, so hammering the mock doesn't allocate a new
+        # record list on every lookup
+        self._mx_cache = {}
 
     def set_response(self, domain: str, has_mx: bool):
         """
@@ -177,6 +281,7 @@ class MockDNSService(DNSServiceBase):
             has_mx: Whether the domain has an MX record
         """
         self.responses[domain] = has_mx
+        self._mx_cache.pop(domain, None)
 
     def check_mx_record(self, domain: str) -> bool:
         """
@@ -188,7 +293,7 @@ class MockDNSService(DNSServiceBase):
         Returns:
             Configured response or False if not configured
         """
-        self.call_history.append(('check_mx_record', domain))
+        self.call_history.append((_CHECK_MX_RECORD, domain))
         return self.responses.get(domain, False)
 
     def get_mx_records(self, domain: str) -> List[tuple]:
@@ -201,10 +306,15 @@ class MockDNSService(DNSServiceBase):
         Returns:
             Mock MX records if domain is configured with True
         """
-        self.call_history.append(('get_mx_records', domain))
-        if self.responses.get(domain, False):
-            return [(10, f'mail.{domain}')]
-        return []
+        self.call_history.append((_GET_MX_RECORDS, domain))
+        cached = self._mx_cache.get(domain)
+        if cached is None:
+            if self.responses.get(domain, False):
+                cached = [(10, f'mail.{domain}')]
+            else:
+                cached = []
+            self._mx_cache[domain] = cached
+        return cached
 
     def reset_history(self):
         """Reset the call history."""
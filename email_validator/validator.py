@@ -4,16 +4,22 @@ Email Validator Module
 Contains the EmailValidator class for validating email addresses.
 """
 
+import concurrent.futures
+import functools
 import re
+import string
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """
     Represents the result of an email validation.
 
+    Uses __slots__ so batch workloads holding thousands of results
+    avoid a per-instance __dict__.
+
     Attributes:
         is_valid: Whether the email is valid
         email: The email address that was validated
@@ -66,14 +72,53 @@ class EmailValidator:
         r")"
         r"@"
         r"(?P<domain>(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+"
-        r"[a-zA-Z]{2,})$"
+        r"[a-zA-Z]{2,})"
+    )
+
+    # The unquoted branch of EMAIL_REGEX compiled on its own. Plain
+    # addresses never need the quoted-string alternation, so the hot
+    # paths match against this simpler pattern and only fall back to
+    # EMAIL_REGEX when the local part is quoted
+    UNQUOTED_EMAIL_REGEX = re.compile(
+        r"(?P<local>"
+        r"[a-zA-Z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-zA-Z0-9!#$%&'*+/=?^_`{|}~-]+)*"
+        r")"
+        r"@"
+        r"(?P<domain>(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+"
+        r"[a-zA-Z]{2,})"
     )
 
+    # Loose "has a TLD" check used for diagnostics on the failure path
+    DOMAIN_TLD_REGEX = re.compile(r'.+\.[a-zA-Z]{2,}\Z')
+
     # Maximum lengths according to RFC 5321
     MAX_EMAIL_LENGTH = 254
     MAX_LOCAL_LENGTH = 64
     MAX_DOMAIN_LENGTH = 255
 
+    # Error messages that depend only on the class constants,
+    # formatted once instead of on every failing call
+    _ERR_EMAIL_TOO_LONG = (
+        f"Email exceeds maximum length of {MAX_EMAIL_LENGTH} characters"
+    )
+    _ERR_LOCAL_TOO_LONG = (
+        f"Local part exceeds maximum length of {MAX_LOCAL_LENGTH} characters"
+    )
+    _ERR_DOMAIN_TOO_LONG = (
+        f"Domain exceeds maximum length of {MAX_DOMAIN_LENGTH} characters"
+    )
+
+    # Every character that can appear in an unquoted address; anything
+    # outside this set can never match EMAIL_REGEX
+    _ALLOWED_CHARS = frozenset(
+        string.ascii_letters + string.digits + "!#$%&'*+/=?^_`{|}~-.@\"\\"
+    )
+
+    # The same set as a bytes delete table: translating an address
+    # with this as the delete argument strips every allowed byte, so
+    # a non-empty result means a disallowed character is present
+    _ALLOWED_BYTES = ''.join(sorted(_ALLOWED_CHARS)).encode('ascii')
+
     def __init__(self, check_mx: bool = False, dns_service=None):
         """
         Initialize the EmailValidator.
@@ -84,6 +129,12 @@ class EmailValidator:
         """
         self.check_mx = check_mx
         self.dns_service = dns_service
+        # Shared thread pool for batch MX lookups, created on first use
+        self._mx_executor = None
+        # Pre-bound matcher: the hot paths call this once per address,
+        # so resolving the class attribute and method object up front
+        # leaves only a fast instance-attribute load per call
+        self._fullmatch_unquoted = self.UNQUOTED_EMAIL_REGEX.fullmatch
 
     def _validate_format(self, email: str) -> tuple[bool, list, list]:
         """
@@ -95,22 +146,47 @@ class EmailValidator:
         Returns:
             Tuple of (is_valid, errors, warnings)
         """
-        errors = []
-        warnings = []
-
         # Check if email is empty
         if not email:
-            errors.append("Email address is empty")
-            return False, errors, warnings
+            return False, ["Email address is empty"], []
 
-        # Check if email is a string
+        # Check if email is a string (non-strings are also unhashable
+        # in general, so they must not reach the cache)
         if not isinstance(email, str):
-            errors.append(f"Email must be a string, got {type(email).__name__}")
-            return False, errors, warnings
+            return False, [f"Email must be a string, got {type(email).__name__}"], []
+
+        is_valid, errors, warnings = self._validate_format_cached(email)
+        # Copy the cached tuples into fresh lists so callers can extend
+        # them without corrupting the shared cache entries.
+        return is_valid, list(errors), list(warnings)
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _validate_format_cached(cls, email: str) -> tuple[bool, tuple, tuple]:
+        """
+        Cached core of the format validation.
+
+        Validation is deterministic for a given address, so repeat
+        lookups of popular addresses skip the regex and string scans
+        entirely. Results are returned as immutable tuples because
+        they are shared between cache hits.
+
+        Args:
+            email: The email address to validate (non-empty string)
 
-        # Check total length
-        if len(email) > self.MAX_EMAIL_LENGTH:
-            errors.append(f"Email exceeds maximum length of {self.MAX_EMAIL_LENGTH} characters")
+        Returns:
+            Tuple of (is_valid, errors, warnings)
+        """
+        # Fast gates: the address grammar is ASCII-only and bounded,
+        # so overlong or non-ASCII input is rejected before any other
+        # work (isascii() runs at C speed over the whole string)
+        if len(email) > cls.MAX_EMAIL_LENGTH:
+            return False, (cls._ERR_EMAIL_TOO_LONG,), ()
+        if not email.isascii():
+            return False, ("Email contains non-ASCII characters",), ()
+
+        errors = []
+        warnings = []
 
         # Check for leading/trailing whitespace
         stripped = email.strip()
@@ -118,30 +194,52 @@ class EmailValidator:
             warnings.append("Email contains leading or trailing whitespace")
             email = stripped
 
-        # Check for consecutive dots
-        if '..' in email:
+        # Single pass over the address, tracking everything the old
+        # per-check scans ('..' in email, ' ' in email, count('@'),
+        # '@.' in email) looked for, so the string is only read once
+        at_count = 0
+        has_space = False
+        has_consecutive_dots = False
+        domain_starts_with_dot = False
+        prev = ''
+        for c in email:
+            if c == '@':
+                at_count += 1
+            elif c == ' ':
+                has_space = True
+            elif c == '.':
+                if prev == '.':
+                    has_consecutive_dots = True
+                elif prev == '@':
+                    domain_starts_with_dot = True
+            prev = c
+
+        if has_consecutive_dots:
             errors.append("Email contains consecutive dots")
-
-        # Check for spaces within email
-        if ' ' in email:
+        if has_space:
             errors.append("Email contains spaces")
-
-        # Check for double @ symbols
-        if email.count('@') > 1:
+        if at_count > 1:
             errors.append("Email contains multiple '@' symbols")
-
-        # Check for domain starting with dot
-        if '@.' in email:
+        if domain_starts_with_dot:
             errors.append("Domain cannot start with a dot")
 
-        # Match against regex pattern
-        match = self.EMAIL_REGEX.match(email)
+        # Match against regex pattern; characters outside the allowed
+        # set can never match unless the local part is quoted, so the
+        # regex can be skipped entirely for that case
+        if email.startswith('"'):
+            match = cls.EMAIL_REGEX.fullmatch(email)
+        elif email.encode('ascii').translate(None, delete=cls._ALLOWED_BYTES):
+            # A disallowed character can never match the unquoted
+            # pattern, and the translate() check is one C loop
+            match = None
+        else:
+            match = cls.UNQUOTED_EMAIL_REGEX.fullmatch(email)
 
         if not match:
             # Provide more specific error messages
-            if '@' not in email:
+            if at_count == 0:
                 errors.append("Email is missing '@' symbol")
-            elif email.count('@') > 1:
+            elif at_count > 1:
                 # Already handled above
                 pass
             else:
@@ -152,8 +250,8 @@ class EmailValidator:
                     # Check local part
                     if not local:
                         errors.append("Local part (before @) is empty")
-                    elif len(local) > self.MAX_LOCAL_LENGTH:
-                        errors.append(f"Local part exceeds maximum length of {self.MAX_LOCAL_LENGTH} characters")
+                    elif len(local) > cls.MAX_LOCAL_LENGTH:
+                        errors.append(cls._ERR_LOCAL_TOO_LONG)
                     elif local.startswith('.'):
                         errors.append("Local part starts with a dot")
                     elif local.endswith('.'):
@@ -162,22 +260,22 @@ class EmailValidator:
                     # Check domain part
                     if not domain:
                         errors.append("Domain part (after @) is empty")
-                    elif len(domain) > self.MAX_DOMAIN_LENGTH:
-                        errors.append(f"Domain exceeds maximum length of {self.MAX_DOMAIN_LENGTH} characters")
-                    elif not re.match(r'.+\.[a-zA-Z]{2,}$', domain):
+                    elif len(domain) > cls.MAX_DOMAIN_LENGTH:
+                        errors.append(cls._ERR_DOMAIN_TOO_LONG)
+                    elif not cls.DOMAIN_TLD_REGEX.match(domain):
                         if '.' not in domain:
                             errors.append("Domain is missing TLD (top-level domain)")
                         else:
                             errors.append("Domain has invalid format")
-            return False, errors, warnings
+            return False, tuple(errors), tuple(warnings)
 
         # Additional validation for matched email
         local = match.group('local')
         domain = match.group('domain')
 
         # Check local part length
-        if len(local) > self.MAX_LOCAL_LENGTH:
-            errors.append(f"Local part exceeds maximum length of {self.MAX_LOCAL_LENGTH} characters")
+        if len(local) > cls.MAX_LOCAL_LENGTH:
+            errors.append(cls._ERR_LOCAL_TOO_LONG)
 
         # Check for quoted strings in local part
         if local.startswith('"') and local.endswith('"'):
@@ -187,7 +285,7 @@ class EmailValidator:
         if '+' in local:
             warnings.append("Plus addressing detected - ensure your system supports this")
 
-        return len(errors) == 0, errors, warnings
+        return len(errors) == 0, tuple(errors), tuple(warnings)
 
     def _check_mx_record(self, email: str) -> tuple[Optional[bool], list]:
         """
@@ -256,22 +354,130 @@ class EmailValidator:
         """
         Validate multiple email addresses.
 
+        For format-only validation the common case — a plain unquoted
+        address that fully matches the compiled pattern — is handled
+        inline without going through validate(), so large batches skip
+        most of the per-call dispatch overhead. Addresses that need
+        diagnostics, warnings or MX checks take the full path.
+
         Args:
             emails: List of email addresses to validate
 
         Returns:
             List of ValidationResult objects
         """
-        return [self.validate(email) for email in emails]
+        if self.check_mx:
+            if self.dns_service is not None:
+                return self._validate_batch_mx(emails)
+            return [self.validate(email) for email in emails]
+
+        results = []
+        append = results.append
+        fullmatch = self._fullmatch_unquoted
+        validate = self.validate
+        max_email = self.MAX_EMAIL_LENGTH
+        max_local = self.MAX_LOCAL_LENGTH
+        for email in emails:
+            if isinstance(email, str) and email and email[0] != '"':
+                match = fullmatch(email)
+                if match is not None and len(email) <= max_email:
+                    local = match.group('local')
+                    if len(local) <= max_local and '+' not in local:
+                        append(ValidationResult(
+                            is_valid=True,
+                            email=email,
+                            errors=[],
+                            warnings=[],
+                            mx_valid=None
+                        ))
+                        continue
+            append(validate(email))
+        return results
+
+    def _validate_batch_mx(self, emails: list) -> list:
+        """
+        Batch validation with MX lookups fanned out over threads.
+
+        Format validation runs serially (it is cheap), then the MX
+        lookups for the distinct domains of format-valid addresses are
+        dispatched to a shared thread pool, so total batch latency is
+        bounded by roughly one DNS round trip instead of one per
+        address.
+
+        Args:
+            emails: List of email addresses to validate
+
+        Returns:
+            List of ValidationResult objects
+        """
+        format_results = [self._validate_format(email) for email in emails]
+
+        domains = {
+            email.rsplit('@', 1)[-1]
+            for email, (format_valid, _, _) in zip(emails, format_results)
+            if format_valid
+        }
+
+        mx_results = {}
+        if domains:
+            if self._mx_executor is None:
+                self._mx_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=32
+                )
+            futures = {
+                domain: self._mx_executor.submit(
+                    self.dns_service.check_mx_record, domain
+                )
+                for domain in domains
+            }
+            for domain, future in futures.items():
+                try:
+                    mx_results[domain] = (future.result(), None)
+                except Exception as e:
+                    mx_results[domain] = (None, f"DNS lookup failed: {str(e)}")
+
+        results = []
+        for email, (format_valid, errors, warnings) in zip(emails, format_results):
+            mx_valid = None
+            if format_valid:
+                mx_valid, mx_error = mx_results[email.rsplit('@', 1)[-1]]
+                if mx_error is not None:
+                    errors.append(mx_error)
+                if mx_valid is False:
+                    # Same semantics as validate(): a missing MX record
+                    # is a warning because the email might still be
+                    # deliverable
+                    warnings.append("No MX record found for domain")
+
+            is_valid = format_valid and (mx_valid is None or mx_valid is True)
+
+            results.append(ValidationResult(
+                is_valid=is_valid,
+                email=email,
+                errors=errors,
+                warnings=warnings,
+                mx_valid=mx_valid
+            ))
+        return results
 
     def is_valid(self, email: str) -> bool:
         """
         Quick check if email is valid.
 
+        Uses a fast path for the common case: a plain unquoted address
+        that fully matches the compiled pattern only needs the two
+        length checks, so no ValidationResult or error strings are
+        built. Everything else falls back to the full validation.
+
         Args:
             email: The email address to validate
 
         Returns:
             True if email is valid, False otherwise
         """
+        if not self.check_mx and isinstance(email, str) and not email.startswith('"'):
+            match = self._fullmatch_unquoted(email)
+            if match is not None:
+                return (len(email) <= self.MAX_EMAIL_LENGTH
+                        and len(match.group('local')) <= self.MAX_LOCAL_LENGTH)
         return self.validate(email).is_valid
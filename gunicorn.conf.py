@@ -0,0 +1,44 @@
+"""
+Gunicorn Configuration for Email Validator API
+
+Run with:
+    gunicorn -c gunicorn.conf.py app:app
+
+Uses gthread workers so DNS-blocked requests (CHECK_MX=true) and
+large batch serializations don't starve the worker pool the way the
+default sync workers do. preload_app shares the compiled regex and
+validator across forks via copy-on-write.
+"""
+
+import multiprocessing
+
+bind = '0.0.0.0:5000'
+
+# Threaded workers: DNS lookups are pure I/O, so threads keep the
+# worker busy while a request waits on the resolver
+worker_class = 'gthread'
+threads = 5
+workers = 2 * multiprocessing.cpu_count() + 1
+
+# Load the app once in the master so workers share read-only state
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Rebuild the DNS resolver after fork.
+
+    With preload_app the DNSService (and its dnspython resolver, which
+    may hold UDP sockets) is created in the master; sharing those
+    sockets across workers is unsafe, so each worker gets a fresh one.
+    """
+    import app
+    if app.dns_service is not None:
+        app.dns_service = app.make_dns_service()
+        app.validator.dns_service = app.dns_service
+        # Thread pools don't survive fork either; drop any executor
+        # created in the master so the worker lazily builds its own
+        app.validator._mx_executor = None
+        # The rebuilt service starts with an empty cache (the warm-up
+        # done at import time happened in the master), so re-warm it
+        # in this worker
+        app.dns_service.prewarm(app.POPULAR_DOMAINS)
@@ -7,13 +7,36 @@ Run with:
 Then open http://localhost:8089 in your browser to control the test.
 """
 
+import itertools
+import json
+import os
 import random
-from locust import HttpUser, task, between, events
+import sys
+import time
+from collections import deque
+
+import gevent
+
+from urllib.parse import quote_plus
+
+from locust import LoadTestShape, task, between, constant, events
+from locust.contrib.fasthttp import FastHttpUser
 from locust.runners import MasterRunner, WorkerRunner
 
+import locust.stats as locust_stats
+
+# Flush CSV stats less often; set at import time so locust's CSV
+# writer (constructed at startup, after the locustfile is loaded)
+# picks it up
+locust_stats.CSV_STATS_FLUSH_INTERVAL_SEC = 10
+
+# Imported after locust so gevent's monkey-patching is already done
+from geventhttpclient import HTTPClient
+
 
-# Sample email datasets for testing
-VALID_EMAILS = [
+# Sample email datasets for testing; tuples so per-user state can
+# reference them directly without defensive copies
+VALID_EMAILS = (
     "user@example.com",
     "john.doe@company.org",
     "alice123@gmail.com",
@@ -34,9 +57,9 @@ VALID_EMAILS = [
     "peter@food.restaurant",
     "quinn@sports.club",
     "rachel@music.band",
-]
+)
 
-INVALID_EMAILS = [
+INVALID_EMAILS = (
     "plainaddress",
     "@missing-local.com",
     "missing-domain@",
@@ -57,83 +80,191 @@ INVALID_EMAILS = [
     "user@domain.",
     "user@domain.com.",
     "user..name@domain.com",
-]
+)
 
 MIXED_EMAILS = VALID_EMAILS + INVALID_EMAILS
 
+# Pre-encoded quick-check URLs: saves an f-string format and a
+# quote_plus call per GET, and correctly encodes addresses like
+# "david+tag@proton.me" that break without URL encoding
+QUICK_URLS = tuple(
+    f"/quick-check?email={quote_plus(email)}" for email in VALID_EMAILS
+)
+
+# Interned request-name literals: the stats engine keys its entries
+# dict by name on every request, and interned strings let the dict
+# lookup short-circuit on identity
+_NAME_VALID = sys.intern("/validate [valid]")
+_NAME_INVALID = sys.intern("/validate [invalid]")
+_NAME_MIXED = sys.intern("/validate [mixed]")
+_NAME_QUICK = sys.intern("/quick-check")
+_NAME_BATCH = sys.intern("/validate/batch")
+_NAME_HEALTH = sys.intern("/health")
+_NAME_VALIDATE = sys.intern("/validate")
+
+# Every (name, method) pair the tasks above can report; used to warm
+# the stats entries dict before traffic starts
+_KNOWN_STATS = (
+    (_NAME_VALID, "POST"),
+    (_NAME_INVALID, "POST"),
+    (_NAME_MIXED, "POST"),
+    (_NAME_QUICK, "GET"),
+    (_NAME_BATCH, "POST"),
+    (_NAME_HEALTH, "GET"),
+    (_NAME_VALIDATE, "POST"),
+)
+
+# Request bodies serialized once at module load; tasks then send
+# fixed bytes instead of running json.dumps on every POST
+JSON_HEADERS = {"Content-Type": "application/json"}
+VALID_BODIES = tuple(
+    json.dumps({"email": email}).encode() for email in VALID_EMAILS
+)
+INVALID_BODIES = tuple(
+    json.dumps({"email": email}).encode() for email in INVALID_EMAILS
+)
+MIXED_BODIES = VALID_BODIES + INVALID_BODIES
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_body(obj):
+    """Serialize a request payload to bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+# Rings of pre-serialized batch payloads of varying sizes, built once
+# at import so the batch tasks send fixed bytes too instead of paying
+# random.sample plus json.dumps per request
+BATCH_BODIES = tuple(
+    _dump_body({"emails": random.sample(MIXED_EMAILS,
+                                        random.randint(5, 10))})
+    for _ in range(256)
+)
+BIG_BATCH_BODIES = tuple(
+    _dump_body({"emails": [random.choice(MIXED_EMAILS)
+                           for _ in range(random.randint(10, 50))]})
+    for _ in range(256)
+)
+
+
+def _shuffled_ring(items, rng=random):
+    """
+    Pad a sequence to a power-of-two length, shuffle it once and
+    return (ring, mask).
+
+    Tasks then cycle through the ring with `i = (i + 1) & mask`, which
+    replaces the per-request random.choice (Mersenne Twister state
+    update plus bounds-checked indexing) with one index and one add on
+    the hot path while keeping the request mix statistically even.
+
+    Pass a per-user random.Random as rng so concurrent greenlets do
+    not all mutate the shared module-level PRNG state.
+    """
+    size = 1
+    while size < len(items):
+        size *= 2
+    ring = list(itertools.islice(itertools.cycle(items), size))
+    rng.shuffle(ring)
+    return tuple(ring), size - 1
+
 
-class EmailValidatorUser(HttpUser):
+class EmailValidatorUser(FastHttpUser):
     """
     Simulates a user of the Email Validator API.
     """
 
     # Wait between 0.5 and 2 seconds between requests
     wait_time = between(0.5, 2)
+    network_timeout = 10.0
+    connection_timeout = 10.0
+    max_retries = 0
 
     def on_start(self):
         """Called when a user starts."""
-        self.valid_emails = VALID_EMAILS.copy()
-        self.invalid_emails = INVALID_EMAILS.copy()
-        self.all_emails = MIXED_EMAILS.copy()
+        self._rng = random.Random(os.urandom(8))
+        self._valid, self._vmask = _shuffled_ring(VALID_BODIES, self._rng)
+        self._vi = 0
+        self._invalid, self._imask = _shuffled_ring(INVALID_BODIES, self._rng)
+        self._ii = 0
+        self._all, self._amask = _shuffled_ring(MIXED_BODIES, self._rng)
+        self._ai = 0
+        self._quick, self._qmask = _shuffled_ring(QUICK_URLS, self._rng)
+        self._qi = 0
+        self._batch, self._bmask = _shuffled_ring(BATCH_BODIES, self._rng)
+        self._bi = 0
 
     @task(10)
     def validate_valid_email(self):
         """Validate a valid email address (most common operation)."""
-        email = random.choice(self.valid_emails)
+        body = self._valid[self._vi]
+        self._vi = (self._vi + 1) & self._vmask
         self.client.post(
             "/validate",
-            json={"email": email},
-            name="/validate [valid]"
+            data=body,
+            headers=JSON_HEADERS,
+            name=_NAME_VALID,
+            catch_response=False
         )
 
     @task(3)
     def validate_invalid_email(self):
         """Validate an invalid email address."""
-        email = random.choice(self.invalid_emails)
+        body = self._invalid[self._ii]
+        self._ii = (self._ii + 1) & self._imask
         self.client.post(
             "/validate",
-            json={"email": email},
-            name="/validate [invalid]"
+            data=body,
+            headers=JSON_HEADERS,
+            name=_NAME_INVALID,
+            catch_response=False
         )
 
     @task(2)
     def validate_random_email(self):
         """Validate a random email from mixed dataset."""
-        email = random.choice(self.all_emails)
+        body = self._all[self._ai]
+        self._ai = (self._ai + 1) & self._amask
         self.client.post(
             "/validate",
-            json={"email": email},
-            name="/validate [mixed]"
+            data=body,
+            headers=JSON_HEADERS,
+            name=_NAME_MIXED,
+            catch_response=False
         )
 
     @task(5)
     def quick_check(self):
         """Quick GET validation check."""
-        email = random.choice(self.valid_emails)
-        self.client.get(
-            f"/quick-check?email={email}",
-            name="/quick-check"
-        )
+        url = self._quick[self._qi]
+        self._qi = (self._qi + 1) & self._qmask
+        self.client.get(url, name=_NAME_QUICK, catch_response=False)
 
     @task(1)
     def validate_batch(self):
         """Validate a batch of emails."""
-        # Pick 5-10 random emails
-        batch_size = random.randint(5, 10)
-        emails = random.sample(self.all_emails, min(batch_size, len(self.all_emails)))
+        body = self._batch[self._bi]
+        self._bi = (self._bi + 1) & self._bmask
         self.client.post(
             "/validate/batch",
-            json={"emails": emails},
-            name="/validate/batch"
+            data=body,
+            headers=JSON_HEADERS,
+            name=_NAME_BATCH,
+            catch_response=False
         )
 
     @task(1)
     def health_check(self):
         """Health check endpoint."""
-        self.client.get("/health", name="/health")
+        self.client.get("/health", name=_NAME_HEALTH, catch_response=False)
 
 
-class QuickValidatorUser(HttpUser):
+class QuickValidatorUser(FastHttpUser):
     """
     A user that only does quick validation checks.
     Higher frequency, lighter load.
@@ -141,14 +272,21 @@ class QuickValidatorUser(HttpUser):
 
     wait_time = between(0.1, 0.5)
 
+    def on_start(self):
+        """Called when a user starts."""
+        self._rng = random.Random(os.urandom(8))
+        self._quick, self._qmask = _shuffled_ring(QUICK_URLS, self._rng)
+        self._qi = 0
+
     @task
     def quick_validate(self):
         """Perform quick validation."""
-        email = random.choice(VALID_EMAILS)
-        self.client.get(f"/quick-check?email={email}")
+        url = self._quick[self._qi]
+        self._qi = (self._qi + 1) & self._qmask
+        self.client.get(url, name=_NAME_QUICK, catch_response=False)
 
 
-class BatchValidatorUser(HttpUser):
+class BatchValidatorUser(FastHttpUser):
     """
     A user that sends batch validation requests.
     Lower frequency, heavier load per request.
@@ -156,48 +294,149 @@ class BatchValidatorUser(HttpUser):
 
     wait_time = between(2, 5)
 
+    def on_start(self):
+        """Called when a user starts."""
+        self._rng = random.Random(os.urandom(8))
+        self._batch, self._bmask = _shuffled_ring(BIG_BATCH_BODIES, self._rng)
+        self._bi = 0
+
     @task
     def batch_validate(self):
         """Send a batch of emails for validation."""
-        batch_size = random.randint(10, 50)
-        emails = [random.choice(MIXED_EMAILS) for _ in range(batch_size)]
+        body = self._batch[self._bi]
+        self._bi = (self._bi + 1) & self._bmask
         self.client.post(
             "/validate/batch",
-            json={"emails": emails}
+            data=body,
+            headers=JSON_HEADERS
+        )
+
+
+class SharedPoolMixin:
+    """
+    Opt-in mixin that sends requests through one module-wide
+    geventhttpclient pool instead of a per-user session.
+
+    With hundreds of users, per-user sessions mean hundreds of TCP
+    connections and TIME_WAIT churn on the generator side; a single
+    shared pool caps the connection count. Timings are reported via
+    the request event so Locust stats stay intact.
+    """
+
+    _shared_client = None
+    _shared_client_lock = gevent.lock.BoundedSemaphore()
+
+    def shared_post(self, path, body, headers, name):
+        """POST via the shared pool and report timing to Locust."""
+        cls = SharedPoolMixin
+        if cls._shared_client is None:
+            # Guarded so the first wave of greenlets doesn't build
+            # (and leak) one pool each
+            with cls._shared_client_lock:
+                if cls._shared_client is None:
+                    cls._shared_client = HTTPClient.from_url(
+                        self.environment.host or "http://localhost:5000",
+                        concurrency=200,
+                        connection_timeout=10,
+                    )
+
+        start = time.perf_counter()
+        exception = None
+        response_length = 0
+        try:
+            response = cls._shared_client.post(path, body=body,
+                                               headers=headers)
+            response_length = len(response.read())
+        except Exception as e:
+            exception = e
+        self.environment.events.request.fire(
+            request_type="POST",
+            name=name,
+            response_time=(time.perf_counter() - start) * 1000,
+            response_length=response_length,
+            response=None,
+            context={},
+            exception=exception,
         )
 
 
-class StressTestUser(HttpUser):
+class StressTestUser(SharedPoolMixin, FastHttpUser):
     """
-    Stress test user with minimal wait time.
-    Used to test maximum throughput.
+    Stress test user with no wait time.
+    Used to test maximum throughput; the gevent scheduler provides
+    the backpressure. Requests go through the shared connection pool
+    since connection churn dominates at this request rate.
     """
 
-    wait_time = between(0.01, 0.1)
+    wait_time = constant(0)
+
+    def on_start(self):
+        """Called when a user starts."""
+        self._rng = random.Random(os.urandom(8))
+        self._bodies, self._bmask = _shuffled_ring(MIXED_BODIES, self._rng)
+        self._bi = 0
 
     @task
     def rapid_validation(self):
         """Rapid-fire validation requests."""
-        email = random.choice(MIXED_EMAILS)
-        self.client.post(
-            "/validate",
-            json={"email": email}
-        )
+        body = self._bodies[self._bi]
+        self._bi = (self._bi + 1) & self._bmask
+        self.shared_post("/validate", body, JSON_HEADERS, name=_NAME_VALIDATE)
 
 
 # Event handlers for custom statistics
+
+# Slow and failed requests are queued here and written in batches by
+# a background greenlet; printing inline from the request listener
+# would serialize every greenlet on the stdout lock, which is worst
+# exactly during the failure storms StressTestUser provokes
+_logq = deque(maxlen=4096)
+
+
+def _flush_logq():
+    """Write all queued log lines with a single stdout write."""
+    if not _logq:
+        return
+    lines = []
+    while _logq:
+        name, response_time, exception = _logq.popleft()
+        if exception:
+            lines.append(f"Request failed: {name} - {exception}")
+        else:
+            lines.append(f"Slow request: {name} took {response_time:.2f}ms")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+_drainer = None
+
+
+def _drain_logq():
+    """Background greenlet: flush the log queue every 500 ms."""
+    while True:
+        gevent.sleep(0.5)
+        _flush_logq()
+
+
 @events.request.add_listener
 def on_request(request_type, name, response_time, response_length, exception, **kwargs):
-    """Log request details for analysis."""
-    if exception:
-        print(f"Request failed: {name} - {exception}")
-    elif response_time > 1000:  # Log slow requests (>1s)
-        print(f"Slow request: {name} took {response_time:.2f}ms")
+    """Queue slow/failed request details for the drain greenlet."""
+    if exception or response_time > 1000:  # Log failures and >1s requests
+        _logq.append((name, response_time, exception))
 
 
 @events.test_start.add_listener
 def on_test_start(environment, **kwargs):
     """Called when test starts."""
+    global _drainer
+    if _drainer is None:
+        _drainer = gevent.spawn(_drain_logq)
+
+    # Pre-register the known stats entries so the entries dict
+    # reaches its final shape before the ramp-up spawn storm starts
+    for name, method in _KNOWN_STATS:
+        environment.stats.get(name, method)
+
     print("=" * 50)
     print("Email Validator Load Test Starting")
     print("=" * 50)
@@ -212,52 +451,62 @@ def on_test_start(environment, **kwargs):
 @events.test_stop.add_listener
 def on_test_stop(environment, **kwargs):
     """Called when test stops."""
-    print("=" * 50)
-    print("Email Validator Load Test Complete")
-    print("=" * 50)
+    _flush_logq()
+
+    lines = [
+        "=" * 50,
+        "Email Validator Load Test Complete",
+        "=" * 50,
+    ]
+
+    # Collect statistics
+    stats = getattr(environment, 'stats', None)
+    if stats is not None:
+        total = stats.total
+        lines += [
+            "",
+            f"Total Requests: {total.num_requests}",
+            f"Total Failures: {total.num_failures}",
+            f"Average Response Time: {total.avg_response_time:.2f}ms",
+            f"Median Response Time: {total.median_response_time:.2f}ms",
+            f"95th Percentile: {total.get_response_time_percentile(0.95):.2f}ms",
+            f"Requests/sec: {total.total_rps:.2f}",
+        ]
 
-    # Print statistics
-    if hasattr(environment, 'stats'):
-        stats = environment.stats
-        print(f"\nTotal Requests: {stats.total.num_requests}")
-        print(f"Total Failures: {stats.total.num_failures}")
-        print(f"Average Response Time: {stats.total.avg_response_time:.2f}ms")
-        print(f"Median Response Time: {stats.total.median_response_time:.2f}ms")
-        print(f"95th Percentile: {stats.total.get_response_time_percentile(0.95):.2f}ms")
-        print(f"Requests/sec: {stats.total.total_rps:.2f}")
+    # One stdout write instead of one lock acquire + flush per line
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 # Custom shape for ramping up load
-class RampUpShape:
+class RampUpShape(LoadTestShape):
     """
     Custom load test shape that ramps up users gradually.
     Use with: locust -f locustfile.py --headless --run-time 5m
     """
 
-    def __init__(self):
-        self.stages = [
-            {"duration": 60, "users": 10, "spawn_rate": 1},   # 1 min: 10 users
-            {"duration": 120, "users": 50, "spawn_rate": 5},  # 2 min: 50 users
-            {"duration": 180, "users": 100, "spawn_rate": 10}, # 3 min: 100 users
-            {"duration": 240, "users": 200, "spawn_rate": 20}, # 4 min: 200 users
-            {"duration": 300, "users": 500, "spawn_rate": 50}, # 5 min: 500 users
-        ]
+    # (end time in seconds, users, spawn rate). Scanned from the
+    # start on every tick: locust reuses the same shape instance
+    # across web-UI stop/start cycles (only the clock is reset), so
+    # tick() must not carry position state between runs — and a
+    # linear scan over five tuples is effectively O(1) anyway.
+    stages = (
+        (60, 10, 1),     # 1 min: 10 users
+        (120, 50, 5),    # 2 min: 50 users
+        (180, 100, 10),  # 3 min: 100 users
+        (240, 200, 20),  # 4 min: 200 users
+        (300, 500, 50),  # 5 min: 500 users
+    )
 
     def tick(self):
         run_time = self.get_run_time()
 
-        for stage in self.stages:
-            if run_time < stage["duration"]:
-                return stage["users"], stage["spawn_rate"]
+        for end, users, spawn_rate in self.stages:
+            if run_time < end:
+                return users, spawn_rate
 
         return None
 
 
-# To use custom shape, uncomment:
-# class ShapeUser(HttpUser):
-#     tasks = [EmailValidatorUser]
-
-
 if __name__ == "__main__":
-    import os
     os.system("locust -f locustfile.py")
@@ -5,12 +5,14 @@ Test Runner Script
 Runs all tests with coverage reporting.
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
 
 def run_tests():
-    """Run tests with coverage."""
+    """Run tests with coverage (or quickly without via --quick)."""
+    quick = "--quick" in sys.argv[1:]
     
     # Change to project directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -20,66 +22,85 @@ def run_tests():
     print("Running Email Validator Tests with Coverage")
     print("=" * 60)
     
-    # Install dependencies if needed
+    # Install dependencies only if something is actually missing:
+    # find_spec is a metadata lookup, while even a no-op pip run costs
+    # seconds of resolver and index startup
     print("\n[1/4] Checking dependencies...")
-    try:
-        subprocess.run(
-            [sys.executable, "-m", "pip", "install", "-q", 
-             "pytest", "pytest-cov", "coverage"],
-            check=True
+    needed = [
+        pip_name
+        for module, pip_name in (
+            ("pytest", "pytest"),
+            ("pytest_cov", "pytest-cov"),
+            ("xdist", "pytest-xdist"),
+            ("coverage", "coverage"),
         )
+        if importlib.util.find_spec(module) is None
+    ]
+    if needed:
+        try:
+            subprocess.run(
+                [sys.executable, "-m", "pip", "install", "-q",
+                 "--disable-pip-version-check", "--no-input", *needed],
+                check=True
+            )
+            print(f"✓ Installed: {', '.join(needed)}")
+        except subprocess.CalledProcessError as e:
+            print(f"✗ Failed to install dependencies: {e}")
+            return 1
+    else:
         print("✓ Dependencies ready")
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to install dependencies: {e}")
-        return 1
     
-    # Run tests with coverage
+    # Run tests in-process: saves the interpreter and plugin boot of
+    # a pytest subprocess (imported here, after the dependency check)
+    import pytest
+    from coverage import Coverage
+
+    # Prefer coverage.py's C tracer (~2x faster than the pure-Python
+    # tracer) when the installed version supports it
+    os.environ.setdefault("COVERAGE_CORE", "ctrace")
+
+    if quick:
+        # Local iteration loop: skip coverage instrumentation (its
+        # tracing slows the run by ~30-50%) and stop on first failure
+        print("\n[2/2] Running tests (quick, no coverage)...")
+        return int(pytest.main(["tests/", "-x", "-q"]))
+
+    # -n auto fans test files out across cores (loadfile keeps each
+    # file's tests on one worker); -x is dropped because stop-on-first
+    # -failure is ineffective with parallel workers anyway
     print("\n[2/4] Running tests...")
-    result = subprocess.run(
-        [sys.executable, "-m", "pytest", 
-         "tests/", 
-         "-v", 
+    returncode = int(pytest.main(
+        ["tests/",
+         "-v",
+         "-n", "auto",
+         "--dist=loadfile",
          "--cov=email_validator",
          "--cov-report=term-missing",
          "--cov-report=html",
-         "--cov-fail-under=95",
-         "-x"],
-        cwd=script_dir
-    )
-    
+         "--cov-fail-under=95"]
+    ))
+
     # Generate coverage report
     print("\n[3/4] Generating coverage report...")
-    if result.returncode == 0:
+    if returncode == 0:
         print("✓ All tests passed!")
         print("✓ Coverage requirement met (>95%)")
-    else:
-        # Check if it was a coverage failure
-        coverage_result = subprocess.run(
-            [sys.executable, "-m", "coverage", "report"],
-            cwd=script_dir,
-            capture_output=True,
-            text=True
-        )
-        print(coverage_result.stdout)
-    
+
     # Print summary
     print("\n[4/4] Test Summary")
     print("-" * 40)
-    
-    # Show detailed coverage
-    coverage_result = subprocess.run(
-        [sys.executable, "-m", "coverage", "report", "--precision=2"],
-        cwd=script_dir,
-        capture_output=True,
-        text=True
-    )
-    print(coverage_result.stdout)
-    
+
+    # Show detailed coverage from the datafile the pytest run wrote,
+    # without spawning `coverage report` subprocesses
+    cov = Coverage()
+    cov.load()
+    cov.report(precision=2, file=sys.stdout)
+
     print("\n" + "=" * 60)
     print("Coverage HTML report generated in: htmlcov/index.html")
     print("=" * 60)
-    
-    return result.returncode
+
+    return returncode
 
 
 if __name__ == "__main__":
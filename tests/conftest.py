@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration for the test suite.
+
+Puts the project root on sys.path once per process so the test
+modules can import the email_validator package without each file
+repeating its own sys.path manipulation (which pytest-xdist workers
+would re-run per file).
+"""
+
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
@@ -7,13 +7,22 @@ Tests for real and mock DNS service implementations.
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 import socket
-
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import time
 
 from email_validator.dns_service import DNSService, MockDNSService, DNSServiceBase
 
+# dnspython exception types used by the resolver tests; imported once
+# per process instead of inside every test body
+try:
+    import dns.exception
+    import dns.resolver
+except ImportError:
+    dns = None
+
+requires_dnspython = pytest.mark.skipif(
+    dns is None, reason="dnspython is not installed"
+)
+
 
 class TestDNSServiceInitialization:
     """Tests for DNSService initialization."""
@@ -37,136 +46,121 @@ class TestDNSServiceInitialization:
         assert service.timeout == 5
 
 
+@pytest.fixture(scope="class")
+def socket_service():
+    """DNSService forced onto the socket fallback path.
+
+    Class-scoped: the fallback tests only call methods, so one
+    instance (and one dnspython availability probe) serves them all.
+    """
+    service = DNSService(timeout=5)
+    service._use_dnspython = False
+    service._resolver = None
+    return service
+
+
+@patch('socket.getaddrinfo')
 class TestDNSServiceWithSocketFallback:
-    """Tests for DNSService using socket fallback."""
+    """Tests for DNSService using socket fallback.
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        # Force socket fallback by setting _use_dnspython to False
-        self.service = DNSService(timeout=5)
-        self.service._use_dnspython = False
-        self.service._resolver = None
+    socket.getaddrinfo is patched once at class level instead of with
+    a context manager per test, and the service under test is built
+    once per class since these tests never mutate it back.
+    """
 
-    def test_check_mx_socket_valid_domain(self):
+    def test_check_mx_socket_valid_domain(self, mock_getaddrinfo, socket_service):
         """Test MX check using socket for valid domain."""
-        with patch('socket.getaddrinfo') as mock_getaddrinfo:
-            mock_getaddrinfo.return_value = [(2, 1, 6, '', ('93.184.216.34', 0))]
-            result = self.service._check_mx_socket('example.com')
-            assert result is True
+        mock_getaddrinfo.return_value = [(2, 1, 6, '', ('93.184.216.34', 0))]
+        result = socket_service._check_mx_socket('example.com')
+        assert result is True
 
-    def test_check_mx_socket_invalid_domain(self):
+    def test_check_mx_socket_invalid_domain(self, mock_getaddrinfo, socket_service):
         """Test MX check using socket for invalid domain."""
-        with patch('socket.getaddrinfo') as mock_getaddrinfo:
-            mock_getaddrinfo.side_effect = socket.gaierror('Domain not found')
-            result = self.service._check_mx_socket('nonexistent.invalid')
-            assert result is False
+        mock_getaddrinfo.side_effect = socket.gaierror('Domain not found')
+        result = socket_service._check_mx_socket('nonexistent.invalid')
+        assert result is False
 
-    def test_check_mx_socket_timeout(self):
+    def test_check_mx_socket_timeout(self, mock_getaddrinfo, socket_service):
         """Test MX check using socket with timeout."""
-        with patch('socket.getaddrinfo') as mock_getaddrinfo:
-            mock_getaddrinfo.side_effect = socket.timeout('DNS timeout')
-            result = self.service._check_mx_socket('timeout.domain')
-            assert result is False
+        mock_getaddrinfo.side_effect = socket.timeout('DNS timeout')
+        result = socket_service._check_mx_socket('timeout.domain')
+        assert result is False
 
-    def test_check_mx_socket_general_exception(self):
+    def test_check_mx_socket_general_exception(self, mock_getaddrinfo, socket_service):
         """Test MX check using socket with general exception."""
-        with patch('socket.getaddrinfo') as mock_getaddrinfo:
-            mock_getaddrinfo.side_effect = Exception('Unexpected error')
-            result = self.service._check_mx_socket('error.domain')
-            assert result is False
+        mock_getaddrinfo.side_effect = Exception('Unexpected error')
+        result = socket_service._check_mx_socket('error.domain')
+        assert result is False
 
-    def test_check_mx_record_fallback(self):
+    def test_check_mx_record_fallback(self, mock_getaddrinfo, socket_service):
         """Test check_mx_record falls back to socket when dnspython unavailable."""
-        with patch.object(self.service, '_check_mx_socket', return_value=True) as mock_socket:
-            result = self.service.check_mx_record('test.com')
+        with patch.object(socket_service, '_check_mx_socket', return_value=True) as mock_socket:
+            result = socket_service.check_mx_record('test.com')
             assert result is True
             mock_socket.assert_called_once_with('test.com')
 
-    def test_get_mx_records_without_dnspython(self):
+    def test_get_mx_records_without_dnspython(self, mock_getaddrinfo, socket_service):
         """Test get_mx_records returns empty list without dnspython."""
-        result = self.service.get_mx_records('example.com')
+        result = socket_service.get_mx_records('example.com')
         assert result == []
 
 
+@requires_dnspython
 class TestDNSServiceWithDnspython:
     """Tests for DNSService using dnspython."""
 
-    def setup_method(self):
-        """Set up test fixtures with mocked resolver."""
-        self.service = DNSService(timeout=5)
+    @pytest.fixture
+    def dns_service(self):
+        """DNSService pre-wired with a mocked dnspython resolver."""
+        service = DNSService(timeout=5)
+        service._resolver = MagicMock()
+        service._use_dnspython = True
+        return service
 
-    def test_check_mx_dnspython_success(self):
+    def test_check_mx_dnspython_success(self, dns_service):
         """Test MX check with dnspython success."""
-        # Mock the resolver
-        mock_resolver = MagicMock()
-        mock_answer = [MagicMock()]
-        mock_resolver.resolve.return_value = mock_answer
-        self.service._resolver = mock_resolver
-        self.service._use_dnspython = True
-
-        result = self.service._check_mx_dnspython('gmail.com')
+        dns_service._resolver.resolve.return_value = [MagicMock()]
+
+        result = dns_service._check_mx_dnspython('gmail.com')
         assert result is True
-        mock_resolver.resolve.assert_called_once_with('gmail.com', 'MX')
+        dns_service._resolver.resolve.assert_called_once_with('gmail.com', 'MX')
 
-    def test_check_mx_dnspython_nxdomain(self):
+    def test_check_mx_dnspython_nxdomain(self, dns_service):
         """Test MX check when domain does not exist."""
-        import dns.resolver
-        
-        mock_resolver = MagicMock()
-        mock_resolver.resolve.side_effect = dns.resolver.NXDOMAIN()
-        self.service._resolver = mock_resolver
-        self.service._use_dnspython = True
+        dns_service._resolver.resolve.side_effect = dns.resolver.NXDOMAIN()
 
-        result = self.service._check_mx_dnspython('nonexistent.invalid')
+        result = dns_service._check_mx_dnspython('nonexistent.invalid')
         assert result is False
 
-    def test_check_mx_dnspython_no_answer(self):
+    def test_check_mx_dnspython_no_answer(self, dns_service):
         """Test MX check when no MX record exists."""
-        import dns.resolver
-        
-        mock_resolver = MagicMock()
-        mock_resolver.resolve.side_effect = dns.resolver.NoAnswer()
-        self.service._resolver = mock_resolver
-        self.service._use_dnspython = True
+        dns_service._resolver.resolve.side_effect = dns.resolver.NoAnswer()
 
-        result = self.service._check_mx_dnspython('no-mx.com')
+        result = dns_service._check_mx_dnspython('no-mx.com')
         assert result is False
 
-    def test_check_mx_dnspython_no_nameservers(self):
+    def test_check_mx_dnspython_no_nameservers(self, dns_service):
         """Test MX check when no nameservers available."""
-        import dns.resolver
-        
-        mock_resolver = MagicMock()
-        mock_resolver.resolve.side_effect = dns.resolver.NoNameservers()
-        self.service._resolver = mock_resolver
-        self.service._use_dnspython = True
+        dns_service._resolver.resolve.side_effect = dns.resolver.NoNameservers()
 
-        result = self.service._check_mx_dnspython('no-ns.com')
+        result = dns_service._check_mx_dnspython('no-ns.com')
         assert result is False
 
-    def test_check_mx_dnspython_timeout(self):
+    def test_check_mx_dnspython_timeout(self, dns_service):
         """Test MX check with DNS timeout."""
-        import dns.exception
-        
-        mock_resolver = MagicMock()
-        mock_resolver.resolve.side_effect = dns.exception.Timeout()
-        self.service._resolver = mock_resolver
-        self.service._use_dnspython = True
+        dns_service._resolver.resolve.side_effect = dns.exception.Timeout()
 
-        result = self.service._check_mx_dnspython('timeout.com')
+        result = dns_service._check_mx_dnspython('timeout.com')
         assert result is False
 
-    def test_check_mx_dnspython_general_exception(self):
+    def test_check_mx_dnspython_general_exception(self, dns_service):
         """Test MX check with general exception."""
-        mock_resolver = MagicMock()
-        mock_resolver.resolve.side_effect = Exception('Unexpected error')
-        self.service._resolver = mock_resolver
-        self.service._use_dnspython = True
+        dns_service._resolver.resolve.side_effect = Exception('Unexpected error')
 
-        result = self.service._check_mx_dnspython('error.com')
+        result = dns_service._check_mx_dnspython('error.com')
         assert result is False
 
-    def test_get_mx_records_success(self):
+    def test_get_mx_records_success(self, dns_service):
         """Test getting MX records successfully."""
         # Mock MX record
         mock_rdata1 = MagicMock()
@@ -177,39 +171,120 @@ class TestDNSServiceWithDnspython:
         mock_rdata2.preference = 20
         mock_rdata2.exchange = 'mail2.example.com'
 
-        mock_answer = [mock_rdata1, mock_rdata2]
+        dns_service._resolver.resolve.return_value = [mock_rdata1, mock_rdata2]
 
-        mock_resolver = MagicMock()
-        mock_resolver.resolve.return_value = mock_answer
-        self.service._resolver = mock_resolver
-        self.service._use_dnspython = True
-
-        records = self.service.get_mx_records('example.com')
+        records = dns_service.get_mx_records('example.com')
         assert len(records) == 2
         assert records[0] == (10, 'mail1.example.com')
         assert records[1] == (20, 'mail2.example.com')
 
-    def test_get_mx_records_exception(self):
+    def test_get_mx_records_exception(self, dns_service):
         """Test getting MX records with exception."""
-        mock_resolver = MagicMock()
-        mock_resolver.resolve.side_effect = Exception('DNS error')
-        self.service._resolver = mock_resolver
-        self.service._use_dnspython = True
+        dns_service._resolver.resolve.side_effect = Exception('DNS error')
 
-        records = self.service.get_mx_records('error.com')
+        records = dns_service.get_mx_records('error.com')
         assert records == []
 
-    def test_check_mx_record_with_dnspython(self):
+    def test_check_mx_record_with_dnspython(self, dns_service):
         """Test check_mx_record with dnspython."""
-        mock_resolver = MagicMock()
-        mock_answer = [MagicMock()]
-        mock_resolver.resolve.return_value = mock_answer
-        self.service._resolver = mock_resolver
-        self.service._use_dnspython = True
+        dns_service._resolver.resolve.return_value = [MagicMock()]
 
-        result = self.service.check_mx_record('gmail.com')
+        result = dns_service.check_mx_record('gmail.com')
         assert result is True
 
+    def test_check_mx_dnspython_module_missing(self, dns_service):
+        """Test graceful failure when the dns module is unavailable."""
+        with patch('email_validator.dns_service.dns', None):
+            assert dns_service._check_mx_dnspython('gmail.com') is False
+
+    def test_get_mx_records_module_missing(self, dns_service):
+        """Test get_mx_records when the dns module is unavailable."""
+        with patch('email_validator.dns_service.dns', None):
+            assert dns_service.get_mx_records('gmail.com') == []
+
+
+class TestDNSServiceCaching:
+    """Tests for the DNSService TTL cache, shared backend and prewarm."""
+
+    @pytest.fixture
+    def service(self):
+        """DNSService on the socket fallback with an empty cache."""
+        svc = DNSService(timeout=5)
+        svc._use_dnspython = False
+        svc._resolver = None
+        return svc
+
+    def test_repeat_lookup_uses_cache(self, service):
+        """Test that a second lookup within the TTL skips the network."""
+        with patch.object(service, '_check_mx_socket', return_value=True) as mock_socket:
+            assert service.check_mx_record('cached.com') is True
+            assert service.check_mx_record('cached.com') is True
+            mock_socket.assert_called_once_with('cached.com')
+
+    def test_negative_result_cached_with_shorter_ttl(self, service):
+        """Test that negative results are cached with the negative TTL."""
+        with patch.object(service, '_check_mx_socket', return_value=False):
+            assert service.check_mx_record('no-mx.com') is False
+
+        has_mx, expiry = service._cache['no-mx.com']
+        assert has_mx is False
+        # The expiry must be within the (shorter) negative TTL window
+        assert expiry <= time.monotonic() + service.NEGATIVE_TTL
+
+    def test_cache_backend_hit_skips_lookup(self):
+        """Test that a shared-cache hit avoids the DNS lookup."""
+        backend = MagicMock()
+        backend.get.return_value = b'1'
+        svc = DNSService(timeout=5, cache_backend=backend)
+        svc._use_dnspython = False
+
+        with patch.object(svc, '_check_mx_socket') as mock_socket:
+            assert svc.check_mx_record('shared.com') is True
+            mock_socket.assert_not_called()
+        backend.get.assert_called_once_with('mx:shared.com')
+
+    def test_cache_backend_write_back(self):
+        """Test that lookup results are written to the shared cache."""
+        backend = MagicMock()
+        backend.get.return_value = None
+        svc = DNSService(timeout=5, cache_backend=backend)
+        svc._use_dnspython = False
+
+        with patch.object(svc, '_check_mx_socket', return_value=True):
+            assert svc.check_mx_record('write.com') is True
+        backend.setex.assert_called_once_with(
+            'mx:write.com', svc.POSITIVE_TTL, '1'
+        )
+
+    def test_cache_backend_errors_fall_through(self):
+        """Test that a failing backend degrades to a normal lookup."""
+        backend = MagicMock()
+        backend.get.side_effect = Exception('backend down')
+        backend.setex.side_effect = Exception('backend down')
+        svc = DNSService(timeout=5, cache_backend=backend)
+        svc._use_dnspython = False
+
+        with patch.object(svc, '_check_mx_socket', return_value=True):
+            assert svc.check_mx_record('flaky.com') is True
+
+    def test_prewarm_populates_cache(self, service):
+        """Test that prewarm resolves domains in the background."""
+        with patch.object(service, '_check_mx_socket', return_value=True):
+            thread = service.prewarm(['warm1.com', 'warm2.com'])
+            thread.join(timeout=5)
+
+        assert 'warm1.com' in service._cache
+        assert 'warm2.com' in service._cache
+
+    def test_lifetime_configures_resolver(self):
+        """Test that timeout and lifetime are applied separately."""
+        svc = DNSService(timeout=3, lifetime=1.5)
+        assert svc.timeout == 3
+        assert svc.lifetime == 1.5
+        if svc._use_dnspython:
+            assert svc._resolver.timeout == 3
+            assert svc._resolver.lifetime == 1.5
+
 
 class TestMockDNSServiceDetailed:
     """Detailed tests for MockDNSService."""
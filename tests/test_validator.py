@@ -5,50 +5,118 @@ Comprehensive tests covering:
 - Valid and invalid email formats
 - Edge cases and boundary conditions
 - MX record checking with mocked DNS service
+
+No mutable state is shared between test classes, so the suite is
+safe to parallelize: pytest -n auto --dist loadfile (run_tests.py
+already invokes it this way). The heavier batch/long-string tests
+carry the 'slow' marker; run pytest -m "not slow" for the fast
+inner loop.
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock, patch
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from email_validator.validator import EmailValidator, ValidationResult
 from email_validator.dns_service import DNSService, MockDNSService
 
 
+# Long throwaway strings used by the length tests, built once at
+# module load instead of per test run
+_A65 = "a" * 65
+_A70 = "a" * 70
+_A250 = "a" * 250
+_A300 = "a" * 300
+
+# Fixed datasets shared by the batched tests below
+VALID_EMAILS = (
+    "user@example.com",
+    "test.email@domain.org",
+    "user123@test-domain.co.uk",
+    "user+tag@example.com",
+    "user_name@example.com",
+    "USER@EXAMPLE.COM",
+    "user@subdomain.example.com",
+    "user@x.co",
+    "test@123domain.com",
+    "user@domain-with-hyphens.com",
+    "simple@domain.io",
+    "user@sub.domain.example.com",
+    "email@domain.travel",
+    "user@domain.museum",
+)
+
+# (email, substring expected in one of the errors)
+INVALID_EMAIL_CASES = (
+    ("", "Email address is empty"),
+    ("plainaddress", "Email is missing '@' symbol"),
+    ("@missing-local.com", "Local part (before @) is empty"),
+    ("missing-at-sign.com", "Email is missing '@' symbol"),
+    ("missing-domain@", "Domain part (after @) is empty"),
+    ("user@.com", "Domain has invalid format"),
+    ("user@domain", "Domain is missing TLD"),
+    ("user@domain.", "Domain has invalid format"),
+    ("user@.domain.com", "Domain cannot start with a dot"),
+    ("user domain@example.com", "Email contains spaces"),
+    ("user@domain .com", "Email contains spaces"),
+    ("user@@double-at.com", "multiple '@' symbols"),
+    ("user@domain..com", "Email contains consecutive dots"),
+    (".user@example.com", "Local part starts with a dot"),
+    ("user.@example.com", "Local part ends with a dot"),
+    ("user..name@example.com", "Email contains consecutive dots"),
+)
+
+# Edge-case addresses that must all be rejected; validated in one
+# batch instead of one test frame apiece
+INVALID_EDGE_EMAILS = (
+    "user@domain@extra.com",   # multiple @ symbols
+    "user@@domain.com",        # consecutive @ symbols
+    "user@sub_domain.com",     # underscore in domain
+    "user@domain..com",        # double dots in domain
+    "user@-domain.com",        # domain starting with hyphen
+    "user@domain-.com",        # domain ending with hyphen
+    "user@domain.a",           # single character TLD
+    "user@domain.123",         # numeric TLD
+    "user\t@domain.com",       # tab character
+    "user\n@domain.com",       # newline
+    "   ",                     # whitespace only
+    "@",                       # @ symbol only
+)
+
+
+@pytest.fixture(scope="module")
+def shared_validator():
+    """One format-only validator shared by the whole module.
+
+    EmailValidator is stateless for check_mx=False, so classes that
+    only need format validation bind this instance instead of
+    constructing a fresh one for every test.
+    """
+    return EmailValidator(check_mx=False)
+
+
 class TestEmailValidatorBasic:
     """Basic tests for EmailValidator without MX checking."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = EmailValidator(check_mx=False)
+    @pytest.fixture(autouse=True)
+    def _bind_validator(self, shared_validator):
+        """Bind the module-scoped validator."""
+        self.validator = shared_validator
 
     # ==================== VALID EMAILS ====================
 
-    @pytest.mark.parametrize("email", [
-        "user@example.com",
-        "test.email@domain.org",
-        "user123@test-domain.co.uk",
-        "user+tag@example.com",
-        "user_name@example.com",
-        "USER@EXAMPLE.COM",
-        "user@subdomain.example.com",
-        "user@x.co",
-        "test@123domain.com",
-        "user@domain-with-hyphens.com",
-        "simple@domain.io",
-        "user@sub.domain.example.com",
-        "email@domain.travel",
-        "user@domain.museum",
-    ])
-    def test_valid_emails(self, email):
-        """Test that valid email addresses pass validation."""
-        result = self.validator.validate(email)
-        assert result.is_valid is True, f"Expected {email} to be valid, got errors: {result.errors}"
-        assert len(result.errors) == 0
+    def test_valid_emails(self):
+        """Test that valid email addresses pass validation in one batch.
+
+        One validate_batch call replaces 14 parametrized test
+        invocations whose per-test harness overhead dwarfed the
+        microsecond validate() calls.
+        """
+        results = self.validator.validate_batch(VALID_EMAILS)
+        bad = [
+            (email, result.errors)
+            for email, result in zip(VALID_EMAILS, results)
+            if not result.is_valid or result.errors
+        ]
+        assert not bad, f"Expected all emails to be valid, got: {bad}"
 
     def test_valid_email_simple(self):
         """Test the simplest valid email format."""
@@ -76,30 +144,23 @@ class TestEmailValidatorBasic:
 
     # ==================== INVALID EMAILS ====================
 
-    @pytest.mark.parametrize("email,expected_error", [
-        ("", "Email address is empty"),
-        ("plainaddress", "Email is missing '@' symbol"),
-        ("@missing-local.com", "Local part (before @) is empty"),
-        ("missing-at-sign.com", "Email is missing '@' symbol"),
-        ("missing-domain@", "Domain part (after @) is empty"),
-        ("user@.com", "Domain has invalid format"),
-        ("user@domain", "Domain is missing TLD"),
-        ("user@domain.", "Domain has invalid format"),
-        ("user@.domain.com", "Domain cannot start with a dot"),
-        ("user domain@example.com", "Email contains spaces"),
-        ("user@domain .com", "Email contains spaces"),
-        ("user@@double-at.com", "multiple '@' symbols"),
-        ("user@domain..com", "Email contains consecutive dots"),
-        (".user@example.com", "Local part starts with a dot"),
-        ("user.@example.com", "Local part ends with a dot"),
-        ("user..name@example.com", "Email contains consecutive dots"),
-    ])
-    def test_invalid_emails(self, email, expected_error):
-        """Test that invalid email addresses fail validation with correct error."""
-        result = self.validator.validate(email)
-        assert result.is_valid is False, f"Expected {email} to be invalid"
-        assert any(expected_error in error for error in result.errors), \
-            f"Expected error containing '{expected_error}' for {email}, got {result.errors}"
+    def test_invalid_emails(self):
+        """Test that invalid email addresses fail with correct errors.
+
+        Batched like test_valid_emails; the expected-error pairing is
+        kept aligned via zip and failures are reported per email.
+        """
+        emails = [email for email, _ in INVALID_EMAIL_CASES]
+        results = self.validator.validate_batch(emails)
+        bad = []
+        for (email, expected_error), result in zip(INVALID_EMAIL_CASES, results):
+            if result.is_valid:
+                bad.append((email, "unexpectedly valid"))
+            # One C-level substring search over the joined errors
+            # instead of a generator with a scan per error string
+            elif expected_error not in "\n".join(result.errors):
+                bad.append((email, result.errors))
+        assert not bad, f"Unexpected validation results: {bad}"
 
     def test_invalid_email_empty(self):
         """Test validation of empty string."""
@@ -140,31 +201,25 @@ class TestEmailValidatorBasic:
 
     def test_email_maximum_length(self):
         """Test email at maximum allowed length."""
-        # Create email exactly at max length (254 chars)
-        local = "a" * 64
+        # Build the longest allowed email analytically: the local
+        # part is capped at 64 chars and the whole address at 254
         domain = "b" * 63 + ".com"
-        email = f"{local}@{domain}"
-        # Adjust to exactly 254
-        while len(email) > 254:
-            local = local[:-1]
-            email = f"{local}@{domain}"
+        local_len = min(64, 254 - 1 - len(domain))
+        email = f"{'a' * local_len}@{domain}"
         result = self.validator.validate(email)
         # Should be valid or have no length-related error
         assert "exceeds maximum length" not in str(result.errors)
 
     def test_email_exceeds_maximum_length(self):
         """Test email exceeding maximum length."""
-        local = "a" * 250
-        domain = "example.com"
-        email = f"{local}@{domain}"
+        email = f"{_A250}@example.com"
         result = self.validator.validate(email)
         assert result.is_valid is False
         assert any("exceeds maximum length" in e for e in result.errors)
 
     def test_local_part_exceeds_maximum_length(self):
         """Test local part exceeding 64 characters."""
-        local = "a" * 65  # Max is 64
-        email = f"{local}@example.com"
+        email = f"{_A65}@example.com"  # Max is 64
         result = self.validator.validate(email)
         assert result.is_valid is False
         assert any("Local part exceeds" in e for e in result.errors)
@@ -182,10 +237,14 @@ class TestEmailValidatorBasic:
     def test_email_with_special_characters(self):
         """Test email with allowed special characters in local part."""
         special_chars = "!#$%&'*+/=?^_`{|}~-"
-        for char in special_chars:
-            email = f"user{char}name@example.com"
-            result = self.validator.validate(email)
-            assert result.is_valid is True, f"Expected {email} with char '{char}' to be valid"
+        emails = [f"user{char}name@example.com" for char in special_chars]
+        results = self.validator.validate_batch(emails)
+        bad = [
+            (email, result.errors)
+            for email, result in zip(emails, results)
+            if not result.is_valid
+        ]
+        assert not bad, f"Expected all special-character emails to be valid, got: {bad}"
 
     def test_email_with_unicode_fails(self):
         """Test that non-ASCII characters are not accepted."""
@@ -237,6 +296,11 @@ class TestEmailValidatorBasic:
         assert self.validator.is_valid("user@example.com") is True
         assert self.validator.is_valid("invalid") is False
 
+    def test_is_valid_enforces_length_limits(self):
+        """Test the is_valid fast path still applies the length caps."""
+        assert self.validator.is_valid(f"{_A65}@example.com") is False
+        assert self.validator.is_valid(f"{_A250}@example.com") is False
+
     def test_validate_batch(self):
         """Test batch validation."""
         emails = [
@@ -304,29 +368,31 @@ class TestEmailValidatorWithMock:
     """Tests using unittest.mock for DNS service."""
 
     def test_with_mock_dns_service(self):
-        """Test using unittest.mock.Mock for DNS service."""
-        mock_dns = Mock()
-        mock_dns.check_mx_record.return_value = True
+        """Test using the bundled MockDNSService for DNS service."""
+        mock_dns = MockDNSService()
+        mock_dns.set_response("example.com", True)
 
         validator = EmailValidator(check_mx=True, dns_service=mock_dns)
         result = validator.validate("user@example.com")
 
         assert result.is_valid is True
-        mock_dns.check_mx_record.assert_called_once_with("example.com")
+        assert mock_dns.call_history == [("check_mx_record", "example.com")]
 
     def test_with_mock_dns_returns_false(self):
         """Test when mocked DNS returns False for MX record."""
-        mock_dns = Mock()
-        mock_dns.check_mx_record.return_value = False
+        mock_dns = MockDNSService()
+        mock_dns.set_response("nonexistent.com", False)
 
         validator = EmailValidator(check_mx=True, dns_service=mock_dns)
         result = validator.validate("user@nonexistent.com")
 
         assert result.mx_valid is False
-        mock_dns.check_mx_record.assert_called_once()
+        assert len(mock_dns.call_history) == 1
 
     def test_with_mock_dns_raises_exception(self):
         """Test handling of DNS service exceptions."""
+        from unittest.mock import Mock
+
         mock_dns = Mock()
         mock_dns.check_mx_record.side_effect = Exception("DNS timeout")
 
@@ -336,39 +402,108 @@ class TestEmailValidatorWithMock:
         assert result.mx_valid is None
         assert any("DNS lookup failed" in e for e in result.errors)
 
-    @patch('email_validator.dns_service.DNSService')
-    def test_with_patch_decorator(self, mock_dns_class):
-        """Test using @patch decorator for mocking."""
-        mock_instance = mock_dns_class.return_value
-        mock_instance.check_mx_record.return_value = True
+    def test_with_patch(self):
+        """Test using unittest.mock.patch for mocking."""
+        from unittest.mock import patch
 
-        validator = EmailValidator(check_mx=True, dns_service=mock_instance)
-        result = validator.validate("test@domain.com")
+        with patch('email_validator.dns_service.DNSService') as mock_dns_class:
+            mock_instance = mock_dns_class.return_value
+            mock_instance.check_mx_record.return_value = True
 
-        assert result.is_valid is True
+            validator = EmailValidator(check_mx=True,
+                                       dns_service=mock_instance)
+            result = validator.validate("test@domain.com")
+
+            assert result.is_valid is True
 
     def test_mock_dns_call_count(self):
         """Test that DNS service is called correct number of times."""
+        mock_dns = MockDNSService()
+        mock_dns.set_response("example.com", True)
+        mock_dns.set_response("example.org", True)
+        mock_dns.set_response("example.net", True)
+
+        validator = EmailValidator(check_mx=True, dns_service=mock_dns)
+
+        # Validate multiple emails in one batch; the batch path looks
+        # each distinct domain up exactly once
+        validator.validate_batch([
+            "user1@example.com",
+            "user2@example.org",
+            "user3@example.net",
+        ])
+
+        mx_calls = [c for c in mock_dns.call_history
+                    if c[0] == "check_mx_record"]
+        assert len(mx_calls) == 3
+
+
+@pytest.fixture(scope="module")
+def shared_mock_dns():
+    """An unconfigured MockDNSService shared by the read-only tests."""
+    return MockDNSService()
+
+
+class TestEmailValidatorBatchMX:
+    """Tests for batch validation with MX checking enabled."""
+
+    def test_batch_mx_deduplicates_domains(self):
+        """Test that a batch looks each distinct domain up once."""
+        mock_dns = MockDNSService({"example.com": True})
+        validator = EmailValidator(check_mx=True, dns_service=mock_dns)
+
+        results = validator.validate_batch([
+            "user1@example.com",
+            "user2@example.com",
+        ])
+
+        assert all(r.is_valid for r in results)
+        assert all(r.mx_valid is True for r in results)
+        assert len(mock_dns.call_history) == 1
+
+    def test_batch_mx_missing_record_is_warning(self):
+        """Test batch MX semantics match validate() for missing records."""
+        mock_dns = MockDNSService({"no-mx-record.invalid": False})
+        validator = EmailValidator(check_mx=True, dns_service=mock_dns)
+
+        result = validator.validate_batch(["user@no-mx-record.invalid"])[0]
+
+        assert result.is_valid is False
+        assert result.mx_valid is False
+        assert any("No MX record" in w for w in result.warnings)
+
+    def test_batch_mx_lookup_failure(self):
+        """Test that a lookup exception surfaces as a DNS error."""
+        from unittest.mock import Mock
+
         mock_dns = Mock()
-        mock_dns.check_mx_record.return_value = True
+        mock_dns.check_mx_record.side_effect = Exception("DNS timeout")
+        validator = EmailValidator(check_mx=True, dns_service=mock_dns)
+
+        result = validator.validate_batch(["user@example.com"])[0]
+
+        assert result.mx_valid is None
+        assert any("DNS lookup failed" in e for e in result.errors)
 
+    def test_batch_mx_skips_invalid_emails(self):
+        """Test that format-invalid emails don't trigger MX lookups."""
+        mock_dns = MockDNSService({"example.com": True})
         validator = EmailValidator(check_mx=True, dns_service=mock_dns)
 
-        # Validate multiple emails
-        validator.validate("user1@example.com")
-        validator.validate("user2@example.com")
-        validator.validate("user3@example.com")
+        results = validator.validate_batch(["user@example.com", "invalid"])
 
-        assert mock_dns.check_mx_record.call_count == 3
+        assert results[0].is_valid is True
+        assert results[1].is_valid is False
+        assert results[1].mx_valid is None
+        assert len(mock_dns.call_history) == 1
 
 
 class TestMockDNSService:
     """Tests for the MockDNSService class."""
 
-    def test_mock_dns_default_response(self):
+    def test_mock_dns_default_response(self, shared_mock_dns):
         """Test default response is False."""
-        mock_dns = MockDNSService()
-        assert mock_dns.check_mx_record("any-domain.com") is False
+        assert shared_mock_dns.check_mx_record("any-domain.com") is False
 
     def test_mock_dns_configured_response(self):
         """Test configured responses."""
@@ -419,52 +554,20 @@ class TestMockDNSService:
 class TestEmailValidatorEdgeCases:
     """Additional edge case tests for comprehensive coverage."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = EmailValidator(check_mx=False)
-
-    def test_multiple_at_symbols(self):
-        """Test email with multiple @ symbols."""
-        result = self.validator.validate("user@domain@extra.com")
-        assert result.is_valid is False
-
-    def test_consecutive_at_symbols(self):
-        """Test email with consecutive @ symbols."""
-        result = self.validator.validate("user@@domain.com")
-        assert result.is_valid is False
-
-    def test_underscore_in_domain(self):
-        """Test email with underscore in domain (invalid)."""
-        result = self.validator.validate("user@sub_domain.com")
-        # Domain with underscore is technically invalid
-        assert result.is_valid is False
-
-    def test_double_dots_in_domain(self):
-        """Test email with double dots in domain."""
-        result = self.validator.validate("user@domain..com")
-        assert result.is_valid is False
-
-    def test_domain_starting_with_hyphen(self):
-        """Test email with domain starting with hyphen."""
-        result = self.validator.validate("user@-domain.com")
-        assert result.is_valid is False
-
-    def test_domain_ending_with_hyphen(self):
-        """Test email with domain ending with hyphen."""
-        result = self.validator.validate("user@domain-.com")
-        assert result.is_valid is False
-
-    def test_tld_single_character(self):
-        """Test email with single character TLD."""
-        result = self.validator.validate("user@domain.a")
-        # Our regex requires at least 2 characters for TLD
-        assert result.is_valid is False
-
-    def test_tld_numeric(self):
-        """Test email with numeric TLD."""
-        result = self.validator.validate("user@domain.123")
-        # TLD should be alphabetic
-        assert result.is_valid is False
+    @pytest.fixture(autouse=True)
+    def _bind_validator(self, shared_validator):
+        """Bind the module-scoped validator."""
+        self.validator = shared_validator
+
+    def test_all_invalid_edge_cases(self):
+        """Test that every edge-case address is rejected, in one batch."""
+        results = self.validator.validate_batch(INVALID_EDGE_EMAILS)
+        bad = [
+            email
+            for email, result in zip(INVALID_EDGE_EMAILS, results)
+            if result.is_valid
+        ]
+        assert not bad, f"Expected all edge-case emails to be invalid, got valid: {bad!r}"
 
     def test_local_part_only_special_chars(self):
         """Test email with only special characters in local part."""
@@ -472,35 +575,24 @@ class TestEmailValidatorEdgeCases:
         # Some special chars combinations might be invalid
         # Depends on regex implementation
 
-    def test_email_with_tab_character(self):
-        """Test email containing tab character."""
-        result = self.validator.validate("user\t@domain.com")
-        assert result.is_valid is False
-
-    def test_email_with_newline(self):
-        """Test email containing newline."""
-        result = self.validator.validate("user\n@domain.com")
-        assert result.is_valid is False
-
+    @pytest.mark.slow
     def test_very_long_domain(self):
         """Test email with very long domain."""
-        domain = "a" * 300 + ".com"
-        email = f"user@{domain}"
+        email = f"user@{_A300}.com"
         result = self.validator.validate(email)
         assert result.is_valid is False
 
     def test_local_part_max_length_in_error_branch(self):
         """Test local part exceeding max length in error branch."""
         # Create email where local part is too long AND has other issues
-        local = "a" * 70  # Over 64 chars
-        email = f"{local}@domain"  # Also missing TLD
+        email = f"{_A70}@domain"  # Over 64 chars and missing TLD
         result = self.validator.validate(email)
         assert result.is_valid is False
 
+    @pytest.mark.slow
     def test_domain_max_length_in_error_branch(self):
         """Test domain exceeding max length in error branch."""
-        domain = "a" * 300  # Over 255 chars
-        email = f"user@{domain}"
+        email = f"user@{_A300}"  # Domain over 255 chars
         result = self.validator.validate(email)
         assert result.is_valid is False
 
@@ -528,20 +620,15 @@ class TestEmailValidatorEdgeCases:
         assert result1.is_valid == result2.is_valid
         assert result1.email == result2.email
 
-    def test_whitespace_only(self):
-        """Test email that is only whitespace."""
-        result = self.validator.validate("   ")
-        assert result.is_valid is False
-
-    def test_at_symbol_only(self):
-        """Test email that is just @."""
-        result = self.validator.validate("@")
-        assert result.is_valid is False
-
 
 class TestValidationResultDetailed:
     """Detailed tests for ValidationResult class."""
 
+    @pytest.fixture(autouse=True)
+    def _bind_validator(self, shared_validator):
+        """Bind the module-scoped validator."""
+        self.validator = shared_validator
+
     def test_result_dataclass_fields(self):
         """Test that ValidationResult has all required fields."""
         result = ValidationResult(
@@ -559,16 +646,14 @@ class TestValidationResultDetailed:
 
     def test_result_with_multiple_errors(self):
         """Test result with multiple validation errors."""
-        validator = EmailValidator(check_mx=False)
         # Invalid email with multiple issues
-        result = validator.validate("..@.com")
+        result = self.validator.validate("..@.com")
         assert len(result.errors) >= 1
 
     def test_result_with_multiple_warnings(self):
         """Test result can have multiple warnings."""
         # Email with plus and whitespace
-        validator = EmailValidator(check_mx=False)
-        result = validator.validate("  user+tag@example.com  ")
+        result = self.validator.validate("  user+tag@example.com  ")
         assert len(result.warnings) >= 1
 
 
@@ -583,6 +668,8 @@ class TestEmailValidatorConfiguration:
 
     def test_mx_check_enabled(self):
         """Test validator with MX check enabled."""
+        from unittest.mock import Mock
+
         mock_dns = Mock()
         validator = EmailValidator(check_mx=True, dns_service=mock_dns)
         assert validator.check_mx is True
@@ -596,28 +683,39 @@ class TestEmailValidatorConfiguration:
 
 
 # Performance-related tests
+@pytest.fixture(scope="class")
+def hundred_valid():
+    """100 valid addresses shared by the performance tests."""
+    return [f"user{i}@example.com" for i in range(100)]
+
+
+@pytest.fixture(scope="class")
+def mixed_hundred():
+    """100 alternating valid/invalid addresses."""
+    emails = []
+    for i in range(50):
+        emails.append(f"user{i}@example.com")  # Valid
+        emails.append(f"invalid-{i}")  # Invalid
+    return emails
+
+
 class TestEmailValidatorPerformance:
     """Tests for validator performance characteristics."""
 
-    def test_batch_validation_performance(self):
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("perf")
+    def test_batch_validation_performance(self, shared_validator, hundred_valid):
         """Test that batch validation works correctly."""
-        validator = EmailValidator(check_mx=False)
-        emails = [f"user{i}@example.com" for i in range(100)]
-
-        results = validator.validate_batch(emails)
+        results = shared_validator.validate_batch(hundred_valid)
 
         assert len(results) == 100
         assert all(r.is_valid for r in results)
 
-    def test_large_batch_with_invalid_emails(self):
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("perf")
+    def test_large_batch_with_invalid_emails(self, shared_validator, mixed_hundred):
         """Test batch validation with mix of valid and invalid."""
-        validator = EmailValidator(check_mx=False)
-        emails = []
-        for i in range(50):
-            emails.append(f"user{i}@example.com")  # Valid
-            emails.append(f"invalid-{i}")  # Invalid
-
-        results = validator.validate_batch(emails)
+        results = shared_validator.validate_batch(mixed_hundred)
 
         assert len(results) == 100
         valid_count = sum(1 for r in results if r.is_valid)